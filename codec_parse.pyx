@@ -0,0 +1,80 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled twin of codec_tester_gui.parse_codec_info.
+Optional: the GUI falls back to the pure-Python parser when this
+module has not been built (see setup.sh).
+"""
+
+cdef dict _KIND = {"SBC": 0, "AAC": 1, "LDAC": 2}
+
+cdef int _kind(str codec_key):
+    k = _KIND.get(codec_key)
+    if k is not None:
+        return k
+    if codec_key.startswith("LHDC"):
+        return 3
+    if codec_key.startswith("APTX"):
+        return 4
+    return -1
+
+
+cpdef dict parse_codec_info(str codec_key, const unsigned char[::1] info_bytes):
+    cdef dict r = {}
+    cdef Py_ssize_t n = info_bytes.shape[0]
+    cdef int kind = _kind(codec_key)
+    cdef unsigned char v
+    cdef unsigned int bits
+    cdef bint hd
+
+    if kind == 0 and n >= 4:
+        v = info_bytes[0]
+        if   v & 0x80: r['sample_rate'] = 16000
+        elif v & 0x40: r['sample_rate'] = 32000
+        elif v & 0x20: r['sample_rate'] = 44100
+        elif v & 0x10: r['sample_rate'] = 48000
+        r['bit_depth'] = 16
+        r['max_kbps'] = 320
+
+    elif kind == 1 and n >= 2:
+        bits = ((info_bytes[0] & 0x0F) << 8) | info_bytes[1]
+        if   bits & 0x800: r['sample_rate'] = 8000
+        elif bits & 0x400: r['sample_rate'] = 11025
+        elif bits & 0x200: r['sample_rate'] = 12000
+        elif bits & 0x100: r['sample_rate'] = 16000
+        elif bits & 0x080: r['sample_rate'] = 22050
+        elif bits & 0x040: r['sample_rate'] = 24000
+        elif bits & 0x020: r['sample_rate'] = 32000
+        elif bits & 0x010: r['sample_rate'] = 44100
+        elif bits & 0x008: r['sample_rate'] = 48000
+        elif bits & 0x002: r['sample_rate'] = 88200
+        elif bits & 0x001: r['sample_rate'] = 96000
+        r['bit_depth'] = 16
+        r['max_kbps'] = 320
+
+    elif kind == 2 and n >= 8:
+        v = info_bytes[6]
+        if   v & 0x20: r['sample_rate'] = 44100
+        elif v & 0x10: r['sample_rate'] = 48000
+        elif v & 0x04: r['sample_rate'] = 88200
+        elif v & 0x02: r['sample_rate'] = 96000
+        r['bit_depth'] = 24
+        v = info_bytes[7] & 0x07
+        r['max_kbps'] = 660 if v == 1 else 330 if v == 2 else 990
+
+    elif kind == 3 and n >= 7:
+        v = info_bytes[6]
+        if   v & 0x08: r['sample_rate'] = 192000
+        elif v & 0x04: r['sample_rate'] = 96000
+        elif v & 0x02: r['sample_rate'] = 48000
+        elif v & 0x01: r['sample_rate'] = 44100
+        r['bit_depth'] = 24
+        r['max_kbps'] = 900
+
+    elif kind == 4 and n >= 7:
+        v = info_bytes[6]
+        if   v & 0x80: r['sample_rate'] = 44100
+        elif v & 0x40: r['sample_rate'] = 48000
+        hd = "HD" in codec_key
+        r['bit_depth'] = 24 if hd else 16
+        r['max_kbps'] = 576 if hd else 352
+    return r
@@ -11,9 +11,8 @@ Usage:
 
 import sys
 import asyncio
+import signal
 import subprocess
-import time
-import readline
 
 from bumble.device import Device
 from bumble.transport import open_transport
@@ -32,12 +31,12 @@ def _patch_bumble():
         from bumble.a2dp import VendorMediaCodecInformation
 
         def _check(self, config):
-            if not hasattr(config, 'vendor_id'):
+            try:
+                v, c = config.vendor_id, config.codec_id
+            except AttributeError:
                 return
-            if config.vendor_id != self.vendor_id:
-                raise ValueError(f"vendor_id mismatch")
-            if config.codec_id != self.codec_id:
-                raise ValueError(f"codec_id mismatch")
+            if v != self.vendor_id or c != self.codec_id:
+                raise ValueError("vendor/codec id mismatch")
 
         VendorMediaCodecInformation.check_configuration = _check
         return True
@@ -103,9 +102,35 @@ CODECS = {
     ),
 }
 
+
+# Capability objects never change between sessions, so build them once.
+# bumble parses the info bytes here; an entry it rejects keeps the
+# exception instead, and is reported as skipped when a session starts.
+def _build_caps():
+    caps = {}
+    for k, (_, mct, info) in CODECS.items():
+        try:
+            caps[k] = MediaCodecCapabilities(
+                media_type=MediaType.AUDIO,
+                media_codec_type=mct,
+                media_codec_information=info
+            )
+        except Exception as e:
+            caps[k] = e
+    return caps
+
+CODEC_CAPS = _build_caps()
+
 # SBC and AAC are always included — SBC is mandatory for A2DP,
 # AAC keeps the HD audio toggle enabled on the phone.
-MANDATORY = ["SBC", "AAC"]
+# The tuple fixes registration order; the frozenset is for membership tests.
+MANDATORY_ORDER = ("SBC", "AAC")
+MANDATORY = frozenset(MANDATORY_ORDER)
+
+
+def resolve(keys):
+    return list(dict.fromkeys([*keys, *MANDATORY_ORDER]))
+
 
 PRESETS = {
     "ALL_LHDC": ["LHDC_V2", "LHDC_V3", "LHDC_V4", "LHDC_V5"],
@@ -127,6 +152,22 @@ MENU_MAP = {
     "15": PRESETS["ALL"],
 }
 
+# Every selection the menu or CLI accepts, resolved up front.
+RESOLVED          = {mk: tuple(resolve(v)) for mk, v in MENU_MAP.items()}
+RESOLVED_BY_CODEC = {k: tuple(resolve([k])) for k in CODECS}
+
+DISPLAY_NAMES = {k: name for k, (name, _, _) in CODECS.items()}
+
+_SELECTIONS = {*RESOLVED.values(), *RESOLVED_BY_CODEC.values()}
+RESOLVED_LABEL = {
+    keys: ", ".join(DISPLAY_NAMES[k] for k in keys) for keys in _SELECTIONS
+}
+SESSION_LABEL = {
+    keys: " + ".join(DISPLAY_NAMES[k] for k in keys) if len(keys) <= 4
+          else f"{len(keys)} codecs"
+    for keys in _SELECTIONS
+}
+
 MENU = """
 ╔══════════════════════════════════════════════════════════════╗
 ║          BLUETOOTH CODEC TEST BENCH v5                       ║
@@ -152,30 +193,28 @@ MENU = """
 ║   0  │ Exit                                                  ║
 ╚══════════════════════════════════════════════════════════════╝"""
 
+MENU_BYTES = (MENU + "\n").encode()
+
 
 def reset_hci(iface=HCI_IFACE):
     print(f"\n  [~] Releasing {iface}...")
-    subprocess.run(['sudo', 'hciconfig', iface, 'down'], capture_output=True, timeout=5)
-    time.sleep(1.0)
-    subprocess.run(['sudo', 'rfkill', 'block',   'bluetooth'], capture_output=True, timeout=5)
-    time.sleep(0.6)
-    subprocess.run(['sudo', 'rfkill', 'unblock', 'bluetooth'], capture_output=True, timeout=5)
-    time.sleep(1.8)
-    subprocess.run(['sudo', 'hciconfig', iface, 'down'], capture_output=True, timeout=5)
-    time.sleep(0.8)
+    # One shell, one sudo — the settle delays run as shell built-ins
+    # instead of separate processes with Python-side sleeps in between.
+    script = (
+        f"hciconfig {iface} down; sleep 1; "
+        f"rfkill block bluetooth; sleep 0.6; "
+        f"rfkill unblock bluetooth; sleep 1.8; "
+        f"hciconfig {iface} down; sleep 0.8"
+    )
+    subprocess.run(['sudo', 'bash', '-c', script], capture_output=True, timeout=10)
     print(f"  [✓] {iface} ready.\n")
 
 
-def resolve(keys):
-    result = list(keys)
-    for m in MANDATORY:
-        if m not in result:
-            result.append(m)
-    return result
-
-
 def pick_codecs():
-    print(MENU)
+    import readline  # noqa: F401 — line editing for the interactive prompt only
+    sys.stdout.flush()
+    sys.stdout.buffer.write(MENU_BYTES)
+    sys.stdout.flush()
     while True:
         try:
             raw = input("\n  Enter number (or codec key, 0 to exit): ").strip()
@@ -189,14 +228,14 @@ def pick_codecs():
             continue
         if raw.lower() in ('0', 'q', 'exit', 'quit'):
             return None
-        if raw in MENU_MAP:
-            keys = resolve(MENU_MAP[raw])
-            print(f"\n  → Registering: {', '.join(CODECS[k][0] for k in keys)}")
+        if raw in RESOLVED:
+            keys = RESOLVED[raw]
+            print(f"\n  → Registering: {RESOLVED_LABEL[keys]}")
             return keys
         upper = raw.upper().replace('-', '_')
-        if upper in CODECS:
-            keys = resolve([upper])
-            print(f"\n  → Registering: {', '.join(CODECS[k][0] for k in keys)}")
+        if upper in RESOLVED_BY_CODEC:
+            keys = RESOLVED_BY_CODEC[upper]
+            print(f"\n  → Registering: {RESOLVED_LABEL[keys]}")
             return keys
         print("  [!] Invalid — enter a number from the menu.")
 
@@ -209,18 +248,16 @@ def make_handler(keys):
             return
         state['fired'] = True
 
-        names = [CODECS[k][0] for k in keys]
-        print(f"\n[!] AVDTP connected — registering: {', '.join(names)}")
+        print(f"\n[!] AVDTP connected — registering: {RESOLVED_LABEL[keys]}")
 
         seids = []
         for key in keys:
             name, mct, info = CODECS[key]
+            caps = CODEC_CAPS[key]
+            if isinstance(caps, Exception):
+                print(f"  [!] {name} skipped — {caps}")
+                continue
             try:
-                caps = MediaCodecCapabilities(
-                    media_type=MediaType.AUDIO,
-                    media_codec_type=mct,
-                    media_codec_information=info
-                )
                 ep = protocol.add_sink(caps)
                 _n = name
                 ep.on('open', lambda n=_n: print(
@@ -231,7 +268,7 @@ def make_handler(keys):
             except Exception as e:
                 print(f"  [!] {name} skipped — {e}")
 
-        primary = next((CODECS[k][0] for k in keys if k not in MANDATORY), "SBC")
+        primary = next((DISPLAY_NAMES[k] for k in keys if k not in MANDATORY), "SBC")
         print(
             f"\n  [✓] Endpoints: {', '.join(seids)}\n"
             f"\n  ┌── ON YOUR PHONE ─────────────────────────────────────\n"
@@ -266,12 +303,21 @@ async def _run_async(keys, transport):
         print("  [✓] Discoverable — waiting for phone...\n"
               "  Press Ctrl+C to return to the menu.\n")
 
-        await asyncio.Event().wait()
+        # Ctrl+C / SIGTERM set the event so the transport closes cleanly
+        # instead of unwinding through KeyboardInterrupt.
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        try:
+            await stop.wait()
+        finally:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(sig)
 
 
 def run_session(keys, transport):
-    names = [CODECS[k][0] for k in keys]
-    label = " + ".join(names) if len(names) <= 4 else f"{len(names)} codecs"
+    label = SESSION_LABEL[keys]
 
     print(f"\n{'═'*58}")
     print(f"  {label}")
@@ -282,6 +328,7 @@ def run_session(keys, transport):
     try:
         asyncio.run(_run_async(keys, transport))
     except KeyboardInterrupt:
+        # Ctrl+C before the signal handlers are installed
         pass
 
 
@@ -291,11 +338,7 @@ def main():
     # Direct CLI: sudo python3 codec_tester.py hci-socket:0 LHDC_V3
     if len(sys.argv) > 2:
         arg = sys.argv[2].upper().replace('-', '_')
-        keys = None
-        if arg in CODECS:
-            keys = resolve([arg])
-        elif arg in MENU_MAP:
-            keys = resolve(MENU_MAP[arg])
+        keys = RESOLVED_BY_CODEC.get(arg) or RESOLVED.get(arg)
         if keys:
             run_session(keys, transport)
             reset_hci()
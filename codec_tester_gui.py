@@ -5,7 +5,8 @@ Turns a Linux laptop into a Bluetooth headphone to probe which audio
 codecs your Android phone supports, with live stream monitoring.
 """
 
-import sys, os, asyncio, subprocess, time, threading, queue, struct, re, inspect, shutil
+import sys, os, asyncio, subprocess, time, threading, queue, struct, re, inspect, shutil, collections
+import socket, fcntl, errno
 import tkinter as tk
 from tkinter import ttk, messagebox
 
@@ -16,19 +17,26 @@ QUALCOMM  = b'\xD0\x00\x00\x00'
 SONY      = b'\x2D\x01\x00\x00'
 SAVITECH  = b'\x3A\x05\x00\x00'
 
+# Info is normalised to immutable bytes: Bumble only parses
+# media_codec_information when it is a bytes instance.
+CodecSpec = collections.namedtuple('CodecSpec', 'name mct info')
+
+def _spec(name: str, mct: int, info: bytes) -> CodecSpec:
+    return CodecSpec(name, mct, bytes(info))
+
 CODECS = {
-    "SBC":           ("SBC",           0x00, b'\xFF\xFF\x02\x35'),
-    "AAC":           ("AAC",           0x02, b'\xF0\x01\x04\x00\xFF\xFF'),
-    "APTX":          ("aptX",          0xFF, QUALCOMM + b'\x01\x00\xFF'),
-    "APTX_HD":       ("aptX-HD",       0xFF, QUALCOMM + b'\x24\x00\xFF\x00\x00\x00\x00'),
-    "APTX_ADAPTIVE": ("aptX-Adaptive", 0xFF, QUALCOMM + b'\xAD\x00' + bytes(10)),
-    "APTX_TWS_PLUS": ("aptX TWS+",     0xFF, QUALCOMM + b'\x05\x00\xFF'),
-    "LDAC":          ("LDAC",          0xFF, SONY  + b'\xAA\x00\x3C\x07'),
+    "SBC":           _spec("SBC",           0x00, b'\xFF\xFF\x02\x35'),
+    "AAC":           _spec("AAC",           0x02, b'\xF0\x01\x04\x00\xFF\xFF'),
+    "APTX":          _spec("aptX",          0xFF, QUALCOMM + b'\x01\x00\xFF'),
+    "APTX_HD":       _spec("aptX-HD",       0xFF, QUALCOMM + b'\x24\x00\xFF\x00\x00\x00\x00'),
+    "APTX_ADAPTIVE": _spec("aptX-Adaptive", 0xFF, QUALCOMM + b'\xAD\x00' + bytes(10)),
+    "APTX_TWS_PLUS": _spec("aptX TWS+",     0xFF, QUALCOMM + b'\x05\x00\xFF'),
+    "LDAC":          _spec("LDAC",          0xFF, SONY  + b'\xAA\x00\x3C\x07'),
     # Root Fixes for Xiaomi/OnePlus LHDC compatibility
-    "LHDC_V2":       ("LHDC V2",       0xFF, SAVITECH + b'\x32\x4C\x26\xF0\x00'),
-    "LHDC_V3":       ("LHDC V3",       0xFF, SAVITECH + b'\x48\x4C\x3E\xF0\x00'), # 0x4C48 is standard for V3
-    "LHDC_V4":       ("LHDC V4",       0xFF, SAVITECH + b'\x34\x4C\x4E\xF0\x00'),
-    "LHDC_V5":       ("LHDC V5",       0xFF, SAVITECH + b'\x35\x4C\x5F\xF0\x00'),
+    "LHDC_V2":       _spec("LHDC V2",       0xFF, SAVITECH + b'\x32\x4C\x26\xF0\x00'),
+    "LHDC_V3":       _spec("LHDC V3",       0xFF, SAVITECH + b'\x48\x4C\x3E\xF0\x00'), # 0x4C48 is standard for V3
+    "LHDC_V4":       _spec("LHDC V4",       0xFF, SAVITECH + b'\x34\x4C\x4E\xF0\x00'),
+    "LHDC_V5":       _spec("LHDC V5",       0xFF, SAVITECH + b'\x35\x4C\x5F\xF0\x00'),
 }
 
 MANDATORY = ["SBC", "AAC"]
@@ -44,55 +52,66 @@ FAMILIES = [
 #  CODEC INFO PARSER
 # ─────────────────────────────────────────────────────────
 
+# Sample-rate capability bits, highest priority first.
+SBC_SR  = {0x80: 16000, 0x40: 32000, 0x20: 44100, 0x10: 48000}
+AAC_SR  = {0x800: 8000,  0x400: 11025, 0x200: 12000, 0x100: 16000,
+           0x080: 22050, 0x040: 24000, 0x020: 32000, 0x010: 44100,
+           0x008: 48000, 0x002: 88200, 0x001: 96000}
+LDAC_SR = {0x20: 44100, 0x10: 48000, 0x04: 88200, 0x02: 96000}
+LHDC_SR = {0x08: 192000, 0x04: 96000, 0x02: 48000, 0x01: 44100}
+APTX_SR = {0x80: 44100, 0x40: 48000}
+
+def _rate_table(masks: dict, size: int) -> list:
+    """Index -> first matching sample rate (or None) for every field value."""
+    return [next((hz for m, hz in masks.items() if v & m), None) for v in range(size)]
+
+SBC_SR_BY_BYTE  = _rate_table(SBC_SR, 256)
+AAC_SR_BY_BITS  = _rate_table(AAC_SR, 4096)
+LDAC_SR_BY_BYTE = _rate_table(LDAC_SR, 256)
+LHDC_SR_BY_BYTE = _rate_table(LHDC_SR, 256)
+APTX_SR_BY_BYTE = _rate_table(APTX_SR, 256)
+
+LDAC_KBPS = [990, 660, 330, 990, 990, 990, 990, 990]
+
+def _put_rate(r: dict, hz):
+    if hz is not None:
+        r['sample_rate'] = hz
+
 def parse_codec_info(codec_key: str, info_bytes: bytes) -> dict:
     r = {}
-    try:
-        b = info_bytes
-        if codec_key == "SBC" and len(b) >= 4:
-            for mask, hz in ((0x80, 16000), (0x40, 32000), (0x20, 44100), (0x10, 48000)):
-                if b[0] & mask:
-                    r['sample_rate'] = hz; break
-            r['bit_depth'] = 16
-            r['max_kbps'] = 320
-
-        elif codec_key == "AAC" and len(b) >= 2:
-            sr_bits = ((b[0] & 0x0F) << 8) | b[1]
-            for mask, hz in ((0x800, 8000), (0x400, 11025), (0x200, 12000),
-                              (0x100, 16000), (0x080, 22050), (0x040, 24000),
-                              (0x020, 32000), (0x010, 44100), (0x008, 48000),
-                              (0x002, 88200), (0x001, 96000)):
-                if sr_bits & mask:
-                    r['sample_rate'] = hz; break
-            r['bit_depth'] = 16
-            r['max_kbps'] = 320
-
-        elif codec_key == "LDAC" and len(b) >= 8:
-            for mask, hz in ((0x20, 44100), (0x10, 48000), (0x04, 88200), (0x02, 96000)):
-                if b[6] & mask:
-                    r['sample_rate'] = hz; break
-            r['bit_depth'] = 24
-            q = b[7] & 0x07
-            r['max_kbps'] = {0: 990, 1: 660, 2: 330}.get(q, 990)
-
-        elif codec_key.startswith("LHDC") and len(b) >= 7:
-            cap0 = b[6]
-            for mask, hz in ((0x08, 192000), (0x04, 96000), (0x02, 48000), (0x01, 44100)):
-                if cap0 & mask:
-                    r['sample_rate'] = hz; break
-            r['bit_depth'] = 24
-            r['max_kbps'] = 900
-
-        elif codec_key.startswith("APTX") and len(b) >= 7:
-            sr_byte = b[6]
-            for mask, hz in ((0x80, 44100), (0x40, 48000)):
-                if sr_byte & mask:
-                    r['sample_rate'] = hz; break
-            r['bit_depth'] = 24 if "HD" in codec_key else 16
-            r['max_kbps'] = 576 if "HD" in codec_key else 352
-    except Exception:
-        pass
+    b = info_bytes
+    if codec_key == "SBC" and len(b) >= 4:
+        _put_rate(r, SBC_SR_BY_BYTE[b[0]])
+        r['bit_depth'] = 16
+        r['max_kbps'] = 320
+
+    elif codec_key == "AAC" and len(b) >= 2:
+        _put_rate(r, AAC_SR_BY_BITS[((b[0] & 0x0F) << 8) | b[1]])
+        r['bit_depth'] = 16
+        r['max_kbps'] = 320
+
+    elif codec_key == "LDAC" and len(b) >= 8:
+        _put_rate(r, LDAC_SR_BY_BYTE[b[6]])
+        r['bit_depth'] = 24
+        r['max_kbps'] = LDAC_KBPS[b[7] & 0x07]
+
+    elif codec_key.startswith("LHDC") and len(b) >= 7:
+        _put_rate(r, LHDC_SR_BY_BYTE[b[6]])
+        r['bit_depth'] = 24
+        r['max_kbps'] = 900
+
+    elif codec_key.startswith("APTX") and len(b) >= 7:
+        _put_rate(r, APTX_SR_BY_BYTE[b[6]])
+        r['bit_depth'] = 24 if "HD" in codec_key else 16
+        r['max_kbps'] = 576 if "HD" in codec_key else 352
     return r
 
+# Use the compiled parser when it has been built (setup.sh, optional).
+try:
+    from codec_parse import parse_codec_info
+except ImportError:
+    pass
+
 # ─────────────────────────────────────────────────────────
 #  BUMBLE VENDOR CODEC PATCH
 # ─────────────────────────────────────────────────────────
@@ -108,10 +127,11 @@ def apply_bumble_patch() -> list:
         
         orig_check = MediaCodecCapabilities.check_configuration
         
-        def _permissive_check(self, configuration):
-            if self.media_codec_type == 0xFF:
-                return 
-            return orig_check(self, configuration)
+        # Defaults bind the original checker and vendor type as fast locals
+        def _permissive_check(self, configuration, _orig=orig_check, _V=0xFF):
+            if self.media_codec_type == _V:
+                return
+            return _orig(self, configuration)
             
         MediaCodecCapabilities.check_configuration = _permissive_check
         return ["SUCCESS: Bumble vendor codec validation bypassed."]
@@ -122,7 +142,55 @@ def apply_bumble_patch() -> list:
 #  HCI RESET
 # ─────────────────────────────────────────────────────────
 
+AF_BLUETOOTH = getattr(socket, 'AF_BLUETOOTH', 31)
+BTPROTO_HCI  = getattr(socket, 'BTPROTO_HCI', 1)
+HCIDEVDOWN   = 0x400448ca            # _IOW('H', 202, int)
+
+RFKILL_TYPE_BLUETOOTH = 2
+RFKILL_OP_CHANGE_ALL  = 3
+_RFKILL_EVENT = struct.Struct('=IBBBB')  # idx, type, op, soft, hard
+
+def _hci_dev_down(dev_id: int):
+    s = socket.socket(AF_BLUETOOTH, socket.SOCK_RAW, BTPROTO_HCI)
+    try:
+        fcntl.ioctl(s.fileno(), HCIDEVDOWN, dev_id)
+    finally:
+        s.close()
+
+def _rfkill_bluetooth(soft: int):
+    fd = os.open('/dev/rfkill', os.O_WRONLY)
+    try:
+        os.write(fd, _RFKILL_EVENT.pack(0, RFKILL_TYPE_BLUETOOTH,
+                                        RFKILL_OP_CHANGE_ALL, soft, 0))
+    finally:
+        os.close(fd)
+
 def reset_hci(iface='hci0'):
+    """
+    Release the adapter via direct ioctls (we already run as root).
+    Falls back to the hciconfig/rfkill commands if the kernel interfaces
+    are unavailable.
+    """
+    try:
+        dev_id = int(iface[3:])
+        _hci_dev_down(dev_id)
+        _rfkill_bluetooth(1)
+        _rfkill_bluetooth(0)
+        # The controller may re-register after unblock; retry the final
+        # down briefly instead of sleeping a fixed amount.
+        deadline = time.monotonic() + 2.0
+        while True:
+            try:
+                _hci_dev_down(dev_id)
+                break
+            except OSError as e:
+                if e.errno != errno.ENODEV or time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+    except (OSError, ValueError):
+        _reset_hci_cmds(iface)
+
+def _reset_hci_cmds(iface):
     for cmd in [
         ['sudo', 'hciconfig', iface, 'down'],
         ['sudo', 'rfkill', 'block',   'bluetooth'],
@@ -137,11 +205,24 @@ def reset_hci(iface='hci0'):
 # ─────────────────────────────────────────────────────────
 
 class AudioPlayer:
+    # Packets queued beyond this are dropped oldest-first so a stalled
+    # ffplay can never back up into the Bumble event loop.
+    MAX_QUEUED = 256
+    # Payloads are aggregated into one pipe write once this many bytes are
+    # pending, or FLUSH_INTERVAL seconds after the previous write.
+    FLUSH_BYTES    = 2048
+    FLUSH_INTERVAL = 0.008
+    # Raw fd for the failsafe dump. O_DIRECT is deliberately absent: it
+    # needs block-aligned buffers, which the aggregation buffer is not.
+    DUMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
     def __init__(self, log_fn):
         self._log = log_fn
         self._proc = None
         self.active = False
-        self.dump_file = None
+        self._dump_fd = None
+        self._q = queue.SimpleQueue()
+        self._writer = None
 
         if shutil.which('ffplay'):
             self._backend = 'ffplay'
@@ -174,66 +255,153 @@ class AudioPlayer:
         try:
             # bufsize=0 is ABSOLUTELY CRITICAL. It prevents Python from choking the stream.
             self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=0)
-            self.active = True
             
             # Save the raw stream to your home folder as a failsafe
             dump_path = os.path.expanduser('~/bumble_stream_dump.sbc')
-            self.dump_file = open(dump_path, 'wb')
+            self._dump_fd = os.open(dump_path, self.DUMP_FLAGS, 0o644)
+
+            # Pipe I/O happens on its own thread, off the asyncio loop
+            self._q = queue.SimpleQueue()
+            self._writer = threading.Thread(target=self._pump, daemon=True,
+                                            args=(self._q, self._proc, self._dump_fd))
+            self.active = True
+            self._writer.start()
             
             self._log(f"  🔊 Audio playing via ffplay (SBC)", 'success')
             self._log(f"  💾 Saving raw backup stream to: {dump_path}", 'info')
         except Exception as e:
             self._log(f"  ⚠️ Audio failed to start: {e}", 'error')
 
-    def write(self, data: bytes):
-        if self.active and self._proc and self._proc.poll() is None:
+    def write(self, data):
+        """Queue a bytes-like chunk (bytes or memoryview) for the player."""
+        if self.active:
+            q = self._q
+            if q.qsize() > self.MAX_QUEUED:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
+            q.put_nowait(data)
+
+    @staticmethod
+    def _write_all(fd, buf):
+        off = 0
+        while off < len(buf):
+            off += os.write(fd, buf[off:] if off else buf)
+
+    def _pump(self, q, proc, dump_fd):
+        # The writer owns the pipe and the dump fd from here on and closes
+        # both on exit, so stop() never closes an fd this thread may still
+        # be writing to.
+        try:
+            self._pump_loop(q, proc.stdin.fileno(), dump_fd)
+        finally:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+            if dump_fd is not None:
+                try:
+                    os.close(dump_fd)
+                except OSError:
+                    pass
+            try:
+                proc.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+    def _pump_loop(self, q, fd, dump_fd):
+        buf = bytearray()
+        last = 0.0
+        done = False
+        while not done:
+            # Idle: block for the next packet. Pending data: wait only
+            # until its flush deadline.
+            timeout = max(0.0, last + self.FLUSH_INTERVAL - time.monotonic()) if buf else None
+            try:
+                item = q.get(timeout=timeout)
+            except queue.Empty:
+                item = b''
+            # Take whatever else is already queued
+            while item is not None:
+                buf += item
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+            done = item is None
+            if not buf:
+                continue
+            now = time.monotonic()
+            if not done and len(buf) < self.FLUSH_BYTES and now - last < self.FLUSH_INTERVAL:
+                continue
             try:
-                # Shove data into the player instantly
-                self._proc.stdin.write(data)
-                self._proc.stdin.flush()
-                # Dump it to the failsafe file
-                if self.dump_file:
-                    self.dump_file.write(data)
+                # Dump to the failsafe file first, so it survives a dead player
+                if dump_fd is not None:
+                    self._write_all(dump_fd, buf)
+                self._write_all(fd, buf)
             except Exception as e:
-                self._log(f"  ⚠️ Audio pipe error: {e}", 'error')
-                self.active = False
+                # Errors after stop() (ffplay terminated) are expected
+                if self._writer is threading.current_thread():
+                    self._log(f"  ⚠️ Audio pipe error: {e}", 'error')
+                    self.active = False
+                return
+            buf.clear()
+            last = now
 
     def stop(self):
+        # Never blocks: this runs on the Bumble loop thread via _on_close.
         self.active = False
-        if self._proc:
-            try:
-                self._proc.stdin.close()
-                self._proc.terminate()
-            except Exception:
-                pass
-            self._proc = None
-            
-        if self.dump_file:
+        writer, proc, dump_fd = self._writer, self._proc, self._dump_fd
+        self._writer = self._proc = self._dump_fd = None
+        if writer:
+            # The writer flushes what is queued and then closes the pipe
+            # and dump fd itself.
+            self._q.put(None)
+        else:
+            # Writer never started, so nobody else will close these
+            if dump_fd is not None:
+                try:
+                    os.close(dump_fd)
+                except OSError:
+                    pass
+            if proc:
+                try:
+                    proc.stdin.close()
+                except Exception:
+                    pass
+        if proc:
+            # Terminate so a write blocked on a stalled ffplay fails fast
             try:
-                self.dump_file.close()
+                proc.terminate()
             except Exception:
                 pass
-            self.dump_file = None
-
 
 # ─────────────────────────────────────────────────────────
 #  BENCH WORKER
 # ─────────────────────────────────────────────────────────
 
 class BenchWorker:
+    # Seconds between bitrate samples
+    BITRATE_INTERVAL = 0.25
 
-    def __init__(self, ev_q: queue.Queue, log_fn):
+    def __init__(self, ev_q: queue.SimpleQueue, log_fn, notify=None):
         self._q = ev_q
         self._log_fn = log_fn
+        self._notify = notify
         self._stop_event: asyncio.Event | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
         self._bitrate_task: asyncio.Task | None = None
-        self.bytes_recv = 0
+        # Received-byte counter as a one-slot list: the RTP callback bumps
+        # it through a closure cell instead of an attribute chain.
+        self._ctr = [0]
         self._audio = AudioPlayer(self._emit_log)
         self._audio_enabled = False
 
     def _emit(self, ev_type, **kw):
         self._q.put({'type': ev_type, **kw})
+        if self._notify is not None:
+            self._notify()
 
     def _emit_log(self, text, level='normal'):
         self._emit('LOG', text=text, level=level)
@@ -279,22 +447,40 @@ class BenchWorker:
 
             listener = Listener(Listener.create_registrar(dev))
             fired = {'v': False}
+            specs = [CODECS[k] for k in codec_keys]
 
             def on_avdtp(protocol):
                 if fired['v']:
                     return
                 fired['v'] = True
 
-                names = [CODECS[k][0] for k in codec_keys]
-                self._emit_log(f"[AVDTP] Connected — registering: {', '.join(names)}")
+                self._emit_log(f"[AVDTP] Connected — registering: "
+                               f"{', '.join(spec.name for spec in specs)}")
+
+                audio_write = self._audio.write
+                ctr = self._ctr
 
-                for key in codec_keys:
-                    name, mct, info = CODECS[key]
+                def _rtp_sbc(pkt):
+                    try:
+                        payload = getattr(pkt, 'payload', bytes(pkt))
+                        n = len(payload)
+                        if n > 1:
+                            # Zero-copy view past the SBC media header
+                            audio_write(memoryview(payload)[1:])
+                        ctr[0] += n
+                    except Exception:
+                        pass
+
+                def _rtp_count_only(pkt):
+                    ctr[0] += len(pkt.payload)
+
+                for key, spec in zip(codec_keys, specs):
+                    name = spec.name
                     try:
                         caps = MediaCodecCapabilities(
                             media_type=MediaType.AUDIO,
-                            media_codec_type=mct,
-                            media_codec_information=info,
+                            media_codec_type=spec.mct,
+                            media_codec_information=spec.info,
                         )
                         ep = protocol.add_sink(caps)
                         self._emit_log(f"  [+] {name}  SEID {ep.seid}")
@@ -314,17 +500,6 @@ class BenchWorker:
                             if self._audio_enabled:
                                 sr = codec_info.get('sample_rate', 44100)
                                 self._audio.start(sample_rate=sr, channels=2, codec_key=k)
-                                
-                                def _on_rtp(pkt):
-                                    try:
-                                        payload = getattr(pkt, 'payload', bytes(pkt))
-                                        # ONLY strip headers and write if it's SBC
-                                        if k == 'SBC' and len(payload) > 1:
-                                            self._audio.write(payload[1:])
-                                        self.bytes_recv += len(payload)
-                                    except Exception:
-                                        pass
-                                endpoint.on('rtp_packet', _on_rtp)
 
                         def _on_close(n=_n):
                             self._emit('STREAM_CLOSED', codec=n)
@@ -332,6 +507,16 @@ class BenchWorker:
 
                         ep.on('open',  _on_open)
                         ep.on('close', _on_close)
+
+                        # The sink endpoint persists across close/reopen, so
+                        # the RTP handler is registered once, here. Only SBC
+                        # playback needs the payload itself; every other
+                        # stream just feeds the bitrate meter. Writes made
+                        # while the player is not running are dropped.
+                        if self._audio_enabled and key == 'SBC':
+                            ep.on('rtp_packet', _rtp_sbc)
+                        else:
+                            ep.on('rtp_packet', _rtp_count_only)
                     except Exception as exc:
                         self._emit_log(f"  [!] {name} skipped: {exc}", 'warning')
 
@@ -346,13 +531,19 @@ class BenchWorker:
             self._emit('DISCOVERABLE')
 
             async def bitrate_loop():
+                # Scale by the measured window so a late wakeup doesn't skew kbps
+                ctr = self._ctr
                 prev = 0
+                t0 = self._loop.time()
                 while not self._stop_event.is_set():
-                    await asyncio.sleep(1.0)
-                    delta = self.bytes_recv - prev
-                    prev = self.bytes_recv
-                    if delta:
-                        self._emit('BITRATE', kbps=delta * 8 / 1000)
+                    await asyncio.sleep(self.BITRATE_INTERVAL)
+                    t1 = self._loop.time()
+                    cur = ctr[0]
+                    delta = cur - prev
+                    prev = cur
+                    if delta and t1 > t0:
+                        self._emit('BITRATE', kbps=delta * 8 / 1000 / (t1 - t0))
+                    t0 = t1
 
             self._bitrate_task = asyncio.ensure_future(bitrate_loop())
             await self._stop_event.wait()
@@ -375,6 +566,26 @@ C = {
     'dim':     '#6c7086',
 }
 
+_LOG_TAGS = frozenset(('info', 'success', 'warning', 'error', 'stream'))
+
+# Keys that may still reach the read-only log box (navigation, focus
+# traversal, copy)
+_LOG_NAV_KEYS = frozenset(('Up', 'Down', 'Left', 'Right', 'Prior', 'Next',
+                           'Home', 'End', 'Tab', 'ISO_Left_Tab'))
+
+def _log_key_filter(ev):
+    if ev.keysym in _LOG_NAV_KEYS or (ev.state & 0x4 and ev.keysym.lower() in ('c', 'a')):
+        return None
+    return 'break'
+
+MAX_EVENTS_PER_TICK = 64
+
+CHART_BARS = 80
+CHART_H    = 60
+
+# Chart colour by int(frac * 255): green below 50 %, yellow to 80 %, red above
+_COLORS = tuple([C['green']] * 128 + [C['yellow']] * 76 + [C['red']] * 52)
+
 class App(tk.Tk):
 
     def __init__(self):
@@ -385,16 +596,27 @@ class App(tk.Tk):
         self.configure(bg=C['bg'])
         self.resizable(True, True)
 
-        self._ev_q: queue.Queue = queue.Queue()
+        self._ev_q: queue.SimpleQueue = queue.SimpleQueue()
         self._worker: BenchWorker | None = None
         self._running = False
         self._codec_vars: dict[str, tk.BooleanVar] = {}
         self._audio_var = tk.BooleanVar(value=False)
-        self._bitrate_history: list[float] = []
+        self._bitrate_history: collections.deque[float] = collections.deque(maxlen=200)
         self._max_kbps = 1000.0
+        self._chart_after = None
+        self._chart_w = 400
+        self._log_batch: list | None = None
+
+        # Worker threads wake the Tk loop by writing to this pipe; they
+        # never call into Tk themselves, which would block them until the
+        # main thread serviced the call. One byte per drain is enough.
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_w, False)
+        self._wake_pending = False
 
         self._build_ui()
-        self.after(100, self._poll)
+        self.tk.createfilehandler(self._wake_r, tk.READABLE, self._on_wake)
+        self.after(500, self._poll)
 
         logs = apply_bumble_patch()
         for line in logs:
@@ -434,7 +656,7 @@ class App(tk.Tk):
                      font=('Helvetica', 8, 'bold'), anchor='w'
                      ).pack(fill='x', pady=(8, 1))
             for key in keys:
-                name = CODECS[key][0]
+                name = CODECS[key].name
                 note = "  ← mandatory" if key in MANDATORY else ""
                 var = tk.BooleanVar(value=(key in MANDATORY))
                 self._codec_vars[key] = var
@@ -517,9 +739,11 @@ class App(tk.Tk):
         tk.Label(chart_frame, text="  Live Bitrate",
                  bg=C['card'], fg=C['dim'],
                  font=('Helvetica', 8)).pack(anchor='w', padx=8, pady=(4, 0))
-        self._chart = tk.Canvas(chart_frame, height=60, bg=C['bg'],
+        self._chart = tk.Canvas(chart_frame, height=CHART_H, bg=C['bg'],
                                 highlightthickness=0)
         self._chart.pack(fill='x', padx=8, pady=4)
+        self._chart.bind('<Configure>', self._on_chart_resize)
+        self._init_chart()
         self._draw_chart()
 
         log_frame = tk.Frame(right, bg=C['panel'])
@@ -532,8 +756,21 @@ class App(tk.Tk):
 
         self._log_txt = tk.Text(log_frame, bg=C['bg'], fg=C['text'],
                                 font=('Courier', 9), wrap='word',
-                                state='disabled', relief='flat',
-                                padx=8, pady=4)
+                                relief='flat', padx=8, pady=4,
+                                insertwidth=0)
+        self._log_insert = self._log_txt.insert
+        # Stays in state 'normal' so inserts need no state toggling;
+        # user edits are swallowed here instead.
+        self._log_txt.bind('<Key>', _log_key_filter)
+        # Text's class binding would insert a tab while state is 'normal';
+        # move focus instead, like any other read-only widget.
+        self._log_txt.bind('<Tab>',
+                           lambda e: (e.widget.tk_focusNext().focus_set(), 'break')[1])
+        for seq in ('<Shift-Tab>', '<ISO_Left_Tab>'):
+            self._log_txt.bind(seq,
+                               lambda e: (e.widget.tk_focusPrev().focus_set(), 'break')[1])
+        for seq in ('<<Paste>>', '<<Cut>>', '<<Clear>>', '<<PasteSelection>>'):
+            self._log_txt.bind(seq, lambda e: 'break')
         sb_log = ttk.Scrollbar(log_frame, command=self._log_txt.yview)
         self._log_txt.configure(yscrollcommand=sb_log.set)
         sb_log.pack(side='right', fill='y')
@@ -574,41 +811,108 @@ class App(tk.Tk):
                 sel.append(m)
         return sel
 
+    def _init_chart(self):
+        # Canvas items are created once and moved/recoloured on redraw
+        c = self._chart
+        # One stepped polygon stands in for the bars
+        self._chart_poly_id = c.create_polygon(0, CHART_H, 0, CHART_H, 0, CHART_H,
+                                               fill=C['green'], outline='',
+                                               state='hidden')
+        self._chart_empty_id = c.create_text(0, 0, text="No data",
+                                             fill=C['dim'], font=('Helvetica', 9))
+        self._chart_cur_id = c.create_text(0, 0, anchor='ne', text="",
+                                           fill=C['text'], font=('Helvetica', 8),
+                                           state='hidden')
+
+    def _on_chart_resize(self, ev):
+        # Width is cached here so redraws don't query winfo_width()
+        self._chart_w = max(ev.width, 400)
+        self._schedule_chart()
+
+    def _schedule_chart(self):
+        # Coalesce bursts of BITRATE events into one redraw per 100 ms
+        if self._chart_after is None:
+            self._chart_after = self.after(100, self._flush_chart)
+
+    def _flush_chart(self):
+        self._chart_after = None
+        self._draw_chart()
+
     def _draw_chart(self):
-        self._chart.delete('all')
-        w = max(self._chart.winfo_width(), 400)
-        h = 60
-        hist = self._bitrate_history[-80:] 
+        c = self._chart
+        w = self._chart_w
+        h = CHART_H
+        hist = list(self._bitrate_history)[-CHART_BARS:]
+        n = len(hist)
+
         if not hist:
-            self._chart.create_text(w // 2, h // 2, text="No data",
-                                     fill=C['dim'], font=('Helvetica', 9))
+            c.coords(self._chart_empty_id, w // 2, h // 2)
+            c.itemconfig(self._chart_empty_id, state='normal')
+            c.itemconfig(self._chart_poly_id, state='hidden')
+            c.itemconfig(self._chart_cur_id, state='hidden')
             return
+        c.itemconfig(self._chart_empty_id, state='hidden')
 
         mx = max(max(hist), self._max_kbps, 1)
-        bar_w = max(w // max(len(hist), 1), 2)
+        bar_w = max(w // n, 2)
+        scale = (h - 10) / mx
 
+        coords = [0, h]
         for i, val in enumerate(hist):
-            x0 = i * bar_w
-            bar_h = int((val / mx) * (h - 10))
-            y0 = h - bar_h
-            frac = val / mx
-            color = C['green'] if frac < 0.5 else C['yellow'] if frac < 0.8 else C['red']
-            self._chart.create_rectangle(x0, y0, x0 + bar_w - 1, h,
-                                          fill=color, outline='')
+            y = h - int(val * scale)
+            coords += (i * bar_w, y, (i + 1) * bar_w, y)
+        coords += (n * bar_w, h)
 
         cur = hist[-1]
-        self._chart.create_text(w - 4, 4, anchor='ne',
-                                 text=f"{cur:.0f} kbps",
-                                 fill=C['text'], font=('Helvetica', 8))
+        c.coords(self._chart_poly_id, *coords)
+        c.itemconfig(self._chart_poly_id, fill=_COLORS[int(cur * 255 / mx)],
+                     state='normal')
+        c.coords(self._chart_cur_id, w - 4, 4)
+        c.itemconfig(self._chart_cur_id, text=f"{cur:.0f} kbps", state='normal')
+
+    def notify(self):
+        """Ask the main loop to drain the event queue (callable from any thread)."""
+        if not self._wake_pending:
+            self._wake_pending = True
+            try:
+                os.write(self._wake_w, b'\0')
+            except OSError:
+                # Pipe full (a wakeup is already pending) or closed
+                pass
 
-    def _poll(self):
+    def _on_wake(self, fd, mask):
         try:
-            while True:
-                ev = self._ev_q.get_nowait()
-                self._handle(ev)
-        except queue.Empty:
+            os.read(fd, 512)
+        except OSError:
             pass
-        self.after(100, self._poll)
+        self._drain()
+
+    def _drain(self):
+        # Cleared before draining: anything queued from here on
+        # triggers a fresh wakeup.
+        self._wake_pending = False
+        # Capped per tick so a burst can't stall the UI; any remainder is
+        # picked up again once Tk is idle. Log lines produced while
+        # handling the batch are inserted together.
+        self._log_batch = batch = []
+        q = self._ev_q
+        try:
+            for _ in range(MAX_EVENTS_PER_TICK):
+                if q.empty():
+                    break
+                self._handle(q.get_nowait())
+            else:
+                if not q.empty():
+                    self.after_idle(self._drain)
+        finally:
+            self._log_batch = None
+            if batch:
+                self._log_flush(batch)
+
+    def _poll(self):
+        # Fallback only — events normally arrive via the wake pipe
+        self._drain()
+        self.after(500, self._poll)
 
     def _handle(self, ev):
         t = ev['type']
@@ -650,10 +954,8 @@ class App(tk.Tk):
         elif t == 'BITRATE':
             kbps = ev.get('kbps', 0)
             self._bitrate_history.append(kbps)
-            if len(self._bitrate_history) > 200:
-                self._bitrate_history = self._bitrate_history[-200:]
             self._c_br.config(text=f"{kbps:.0f} kbps", fg=C['text'])
-            self._draw_chart()
+            self._schedule_chart()
         elif t == 'DONE':
             self._running = False
             self._set_btns(running=False)
@@ -665,6 +967,7 @@ class App(tk.Tk):
     def _do_reset(self):
         reset_hci()
         self._ev_q.put({'type': 'LOG', 'text': "[✓] HCI ready.", 'level': 'info'})
+        self.notify()
 
     def _start(self):
         keys = self._get_keys()
@@ -675,13 +978,13 @@ class App(tk.Tk):
         self._set_btns(running=True)
         self._clear_log()
         self._reset_cards()
-        self._bitrate_history = []
+        self._bitrate_history.clear()
         self._draw_chart()
 
-        names = [CODECS[k][0] for k in keys]
+        names = [CODECS[k].name for k in keys]
         self._log(f"Starting session: {', '.join(names)}", 'info')
 
-        self._worker = BenchWorker(self._ev_q, self._log)
+        self._worker = BenchWorker(self._ev_q, self._log, self.notify)
         self._worker.start(keys, 'hci-socket:0', self._audio_var.get())
 
     def _stop(self):
@@ -705,21 +1008,25 @@ class App(tk.Tk):
             getattr(self, attr).config(text="—", fg=C['text'])
 
     def _log(self, text, level='normal'):
-        self._log_txt.config(state='normal')
-        tag = level if level in ('info','success','warning','error','stream') else ''
-        self._log_txt.insert('end', text + '\n', tag)
+        tag = level if level in _LOG_TAGS else ''
+        if self._log_batch is not None:
+            self._log_batch += (text, tag, '\n', tag)
+        else:
+            self._log_flush((text, tag, '\n', tag))
+
+    def _log_flush(self, chunks):
+        # chunks is a flat (text, tag, text, tag, ...) sequence for Text.insert
+        self._log_insert('end', *chunks)
         self._log_txt.see('end')
-        self._log_txt.config(state='disabled')
 
     def _clear_log(self):
-        self._log_txt.config(state='normal')
         self._log_txt.delete('1.0', 'end')
-        self._log_txt.config(state='disabled')
 
     def on_close(self):
         if self._worker:
             self._worker.stop()
             time.sleep(0.4)
+        self.tk.deletefilehandler(self._wake_r)
         self.destroy()
 
 def main():
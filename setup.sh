@@ -15,7 +15,7 @@ echo "╚═══════════════════════
 echo ""
 
 # ── 1. System packages ──────────────────────────────────────────────────────
-echo "[1/6] Checking system packages..."
+echo "[1/7] Checking system packages..."
 MISSING=()
 for pkg in python3 python3-venv python3-tk rfkill; do
     dpkg -s "$pkg" &>/dev/null || MISSING+=("$pkg")
@@ -28,7 +28,7 @@ else
 fi
 
 # ── 2. Python venv ──────────────────────────────────────────────────────────
-echo "[2/6] Setting up Python virtual environment at $VENV_DIR..."
+echo "[2/7] Setting up Python virtual environment at $VENV_DIR..."
 if [ ! -d "$VENV_DIR" ]; then
     python3 -m venv "$VENV_DIR"
     echo "      Created."
@@ -37,12 +37,21 @@ else
 fi
 
 # ── 3. bumble ───────────────────────────────────────────────────────────────
-echo "[3/6] Installing/updating bumble..."
+echo "[3/7] Installing/updating bumble..."
 "$VENV_DIR/bin/pip" install --upgrade bumble --quiet
 echo "      bumble installed: $("$VENV_DIR/bin/pip" show bumble | grep Version)"
 
-# ── 4. Optional: ffmpeg for audio output ───────────────────────────────────
-echo "[4/6] Checking audio output (optional)..."
+# ── 4. Optional: compiled codec parser ─────────────────────────────────────
+echo "[4/7] Building compiled codec parser (optional)..."
+if "$VENV_DIR/bin/pip" install --upgrade cython --quiet 2>/dev/null \
+   && (cd "$SCRIPT_DIR" && "$VENV_DIR/bin/cythonize" -i -q codec_parse.pyx) &>/dev/null; then
+    echo "      Built — the GUI will use it automatically."
+else
+    echo "      Skipped (needs a C compiler + python3-dev). Pure-Python parser will be used."
+fi
+
+# ── 5. Optional: ffmpeg for audio output ───────────────────────────────────
+echo "[5/7] Checking audio output (optional)..."
 if command -v pacat &>/dev/null; then
     echo "      pacat (PipeWire/PulseAudio) found — audio output supported."
 elif command -v ffplay &>/dev/null; then
@@ -52,16 +61,16 @@ else
     echo "      To enable, install PipeWire:  sudo apt-get install pipewire"
 fi
 
-# ── 5. Disable system Bluetooth daemon ─────────────────────────────────────
-echo "[5/6] Disabling system Bluetooth daemon (it conflicts with bumble)..."
+# ── 6. Disable system Bluetooth daemon ─────────────────────────────────────
+echo "[6/7] Disabling system Bluetooth daemon (it conflicts with bumble)..."
 if systemctl is-active --quiet bluetooth; then
     sudo systemctl stop bluetooth
     echo "      Stopped."
 fi
 sudo systemctl disable bluetooth 2>/dev/null && echo "      Disabled at boot." || true
 
-# ── 6. sudo rules (optional — avoids password prompt every run) ─────────────
-echo "[6/6] Setting up sudo rules for hciconfig/rfkill (optional)..."
+# ── 7. sudo rules (optional — avoids password prompt every run) ─────────────
+echo "[7/7] Setting up sudo rules for hciconfig/rfkill (optional)..."
 SUDOERS_FILE="/etc/sudoers.d/bt-codec-bench"
 if [ ! -f "$SUDOERS_FILE" ]; then
     read -p "      Allow passwordless hciconfig/rfkill for $USER? [y/N] " ans